@@ -0,0 +1,507 @@
+import base64
+import hashlib
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import streamlit as st
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, padding, rsa, utils
+
+try:
+    # SIMD (SSSE3/AVX2) base64, several times faster than the stdlib on
+    # the batch verify path; optional, stdlib fallback below.
+    import pybase64 as b64
+except ImportError:
+    b64 = base64
+
+try:
+    # SIMD cache-key hashing for bytes arguments: blake3 is several times
+    # faster than Streamlit's default hasher on large inputs. Not used for
+    # anything security-relevant; optional, SHA-256 fallback below.
+    import blake3
+
+    _CACHE_HASH_FUNCS = {bytes: lambda data: blake3.blake3(data).digest()}
+except ImportError:
+    _CACHE_HASH_FUNCS = {bytes: lambda data: hashlib.sha256(data).digest()}
+
+ALGORITHMS = ["Ed25519", "RSA-2048"]
+
+# Pinned on purpose: 2048-bit moduli are the shape OpenSSL 3.2+'s AVX-IFMA
+# modexp kernels accelerate (1.8-2.2x on sign), and 4096-bit RSA is ~7x
+# slower for no practical security gain in this application.
+RSA_KEY_SIZE = 2048
+
+# Padding/hash descriptors are stateless; hoisted so the batch verify loop
+# only pays for the cryptographic work, not per-call object construction.
+_SHA256 = hashes.SHA256()
+_PREHASHED_SHA256 = utils.Prehashed(_SHA256)
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(_SHA256), salt_length=padding.PSS.DIGEST_LENGTH
+)
+
+
+@st.cache_resource
+def _openssl_info():
+    """Report the OpenSSL build backing ``cryptography``.
+
+    Returns:
+        A ``(version_text, has_ifma_modexp)`` tuple, where the flag is
+        True for OpenSSL >= 3.2 — the release that ships the AVX-IFMA
+        modexp kernels for 2048-bit RSA.
+    """
+    from cryptography.hazmat.backends.openssl import backend
+
+    return (
+        backend.openssl_version_text(),
+        backend.openssl_version_number() >= 0x30200000,
+    )
+
+
+@st.cache_resource
+def _sha256_is_hardware_accelerated():
+    """Heuristic probe for hardware-accelerated SHA-256.
+
+    Times ``hashlib.sha256`` over a 1 MiB buffer. OpenSSL builds without
+    assembly (``no-asm``, or dispatch forced off via ``OPENSSL_ia32cap``)
+    hash several times slower than SHA-NI/NEON builds, so a coarse
+    throughput threshold of ~1 GiB/s cleanly separates the two on any
+    recent core. Cached so the probe runs once per server process.
+
+    Returns:
+        True if SHA-256 throughput looks hardware-assisted.
+    """
+    buf = b"x" * (1 << 20)
+    best_ns = None
+    for _ in range(5):
+        start = time.perf_counter_ns()
+        hashlib.sha256(buf).digest()
+        elapsed = time.perf_counter_ns() - start
+        if best_ns is None or elapsed < best_ns:
+            best_ns = elapsed
+    gib_per_s = (1 << 20) / (best_ns / 1e9) / (1 << 30)
+    return gib_per_s >= 1.0
+
+
+def hash_stream(fileobj):
+    """Stream-hash a file object with SHA-256 and return the 32-byte digest.
+
+    Streamlit holds uploads in memory as ``BytesIO`` objects; for those,
+    hashing the ``getbuffer()`` memoryview hands OpenSSL the existing
+    buffer directly, with no read copy and independent of the current
+    seek position. Anything else goes through :func:`hashlib.file_digest`
+    (Python 3.11+), whose zero-copy ``readinto`` loop keeps the whole
+    hash pass inside C/OpenSSL and releases the GIL. Either way the hash
+    runs at SHA-NI throughput.
+
+    Args:
+        fileobj: A binary file-like object positioned at the start.
+
+    Returns:
+        The SHA-256 digest of the stream.
+    """
+    if isinstance(fileobj, io.BytesIO):
+        return hashlib.sha256(fileobj.getbuffer()).digest()
+    return hashlib.file_digest(fileobj, "sha256").digest()
+
+
+def generate_keys(algorithm="Ed25519"):
+    """Generate a fresh key pair for the chosen signature algorithm.
+
+    Ed25519 is the default: key generation and signing are a single scalar
+    multiplication instead of RSA's modular exponentiation, an order of
+    magnitude faster at equivalent security. RSA-2048 remains available for
+    interoperability with existing keys; RSA keys are built with the
+    explicit ``e=65537`` and carry precomputed CRT components
+    (``dmp1``/``dmq1``/``iqmp``), so OpenSSL signs via CRT + Montgomery —
+    roughly 4x faster than a raw full-size modexp.
+
+    Args:
+        algorithm: One of ``ALGORITHMS``.
+
+    Returns:
+        A ``(private_key, public_key)`` tuple of OpenSSL-backed key objects.
+    """
+    if algorithm == "Ed25519":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    else:
+        private_key = rsa.generate_private_key(
+            public_exponent=65537, key_size=RSA_KEY_SIZE
+        )
+    return private_key, private_key.public_key()
+
+
+@st.cache_resource
+def _keygen_pool():
+    """Single-worker pool so key generation runs off the script thread.
+
+    Streamlit re-executes this whole script on every rerun, so the pool
+    must live behind ``cache_resource`` — built at module level it would
+    be reconstructed (and its worker respawned) on each interaction.
+    """
+    return ProcessPoolExecutor(max_workers=1)
+
+
+def _generate_keys_worker(algorithm):
+    """Generate a key pair in the worker process, returned as private PEM.
+
+    Key objects hold OpenSSL handles and do not pickle, so the key
+    crosses the process boundary serialized; the public half is derived
+    again on the parent side.
+    """
+    private_key, _ = generate_keys(algorithm)
+    return private_key_to_pem(private_key)
+
+
+def _generate_keys_async(algorithm):
+    """Generate a key pair in the worker pool with a spinner shown.
+
+    Deliberately uncached: ``st.cache_resource`` is shared across all
+    sessions, so a cached key pair would be handed to other users. Rerun
+    protection already comes from ``session_state`` — this only runs on an
+    explicit "Generate New Key Pair" click.
+    """
+    future = _keygen_pool().submit(_generate_keys_worker, algorithm)
+    with st.spinner("Generating key pair..."):
+        private_pem = future.result()
+    private_key = serialization.load_pem_private_key(private_pem, password=None)
+    return private_key, private_key.public_key()
+
+
+@st.cache_resource(hash_funcs=_CACHE_HASH_FUNCS)
+def _load_public_key(pem_bytes):
+    """Parse a public-key PEM, cached on the PEM bytes.
+
+    PEM parsing does ASN.1 decoding on every call; caching means reruns
+    with the same uploaded key file skip it. ``cache_resource`` rather
+    than ``cache_data`` because key objects do not pickle.
+    """
+    return serialization.load_pem_public_key(pem_bytes)
+
+
+@st.cache_resource(hash_funcs=_CACHE_HASH_FUNCS)
+def _load_private_key(pem_bytes, passphrase=None):
+    """Parse a private-key PEM, cached on the PEM bytes and passphrase."""
+    password = passphrase.encode() if passphrase else None
+    return serialization.load_pem_private_key(pem_bytes, password=password)
+
+
+def sign_document(document_digest, private_key):
+    """Sign a pre-computed SHA-256 document digest with the private key.
+
+    RSA keys sign the digest directly via ``Prehashed`` with RSA-PSS
+    padding, so the whole-file hash pass from :func:`hash_stream` is not
+    repeated inside OpenSSL. Ed25519 has no prehashed variant in
+    ``cryptography``, so the 32-byte digest is signed as the message.
+
+    Args:
+        document_digest: The SHA-256 digest of the document.
+        private_key: An Ed25519 or RSA private key object.
+
+    Returns:
+        The signature, base64-encoded as bytes.
+    """
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        signature = private_key.sign(document_digest)
+    else:
+        signature = private_key.sign(
+            document_digest, _PSS_PADDING, _PREHASHED_SHA256
+        )
+    return b64.b64encode(signature)
+
+
+def verify_document(document_digest, signature_b64, public_key):
+    """Verify a base64-encoded signature against a SHA-256 document digest.
+
+    Args:
+        document_digest: The SHA-256 digest of the document.
+        signature_b64: The base64-encoded signature to check.
+        public_key: The Ed25519 or RSA public key matching the signer.
+
+    Returns:
+        True if the signature is valid, False otherwise.
+    """
+    try:
+        signature = b64.b64decode(signature_b64)
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            public_key.verify(signature, document_digest)
+        else:
+            public_key.verify(
+                signature, document_digest, _PSS_PADDING, _PREHASHED_SHA256
+            )
+        return True
+    except (InvalidSignature, ValueError):
+        return False
+
+
+def sign_file_stream(fileobj, private_key):
+    """Hash a file object and sign the digest in a single pass.
+
+    Fuses :func:`hash_stream` and :func:`sign_document` so page code
+    never holds more than the 32-byte digest at the Python boundary.
+    """
+    return sign_document(hash_stream(fileobj), private_key)
+
+
+def verify_file_stream(fileobj, signature_b64, public_key):
+    """Hash a file object and verify the signature against its digest."""
+    return verify_document(hash_stream(fileobj), signature_b64, public_key)
+
+
+def _cached_digest(uploaded_file):
+    """Return the SHA-256 digest of an upload, cached in session state.
+
+    Keyed on the upload's ``file_id``, which Streamlit assigns uniquely
+    per uploaded file, so repeated "Verify Signature" clicks against the
+    same upload (e.g. trying different signatures) only pay for the
+    bignum verify, not a fresh hash pass — while a replacement file,
+    even with the same name and size, always gets rehashed. Only the
+    most recent digest is kept, so the session does not grow with each
+    new upload.
+    """
+    cached = st.session_state.get("verify_digest")
+    if cached is None or cached[0] != uploaded_file.file_id:
+        cached = (uploaded_file.file_id, hash_stream(uploaded_file))
+        st.session_state.verify_digest = cached
+    return cached[1]
+
+
+def verify_batch(documents, public_key):
+    """Verify a batch of documents in parallel and collect the results.
+
+    Hashing and signature verification both release the GIL inside
+    OpenSSL, so a thread pool scales with cores on batch workloads.
+
+    Args:
+        documents: Iterable of ``(name, fileobj, signature_b64)`` triples.
+        public_key: The public key to verify every signature against.
+
+    Returns:
+        A list of ``(name, is_valid)`` tuples in input order.
+    """
+
+    def _verify_one(item):
+        name, fileobj, signature_b64 = item
+        return name, verify_file_stream(fileobj, signature_b64, public_key)
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(_verify_one, documents))
+
+
+def private_key_to_pem(private_key, passphrase=None):
+    """Serialize a private key to PKCS#8 PEM bytes.
+
+    With a passphrase the PEM is encrypted via ``BestAvailableEncryption``,
+    which rides OpenSSL's AES-NI path; without one it is unencrypted.
+    """
+    if passphrase:
+        encryption = serialization.BestAvailableEncryption(passphrase.encode())
+    else:
+        encryption = serialization.NoEncryption()
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        encryption,
+    )
+
+
+def public_key_to_pem(public_key):
+    """Serialize a public key to SubjectPublicKeyInfo PEM bytes."""
+    return public_key.public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def main():
+    st.set_page_config(page_title="VoteChain", page_icon="🗳️")
+    st.title("VoteChain Document Signing")
+
+    if "private_key" not in st.session_state:
+        st.session_state.private_key = None
+        st.session_state.public_key = None
+        # PEM serializations are fixed once a key pair exists, so they are
+        # computed at generation/import time rather than on every rerun.
+        st.session_state.private_key_pem = None
+        st.session_state.public_key_pem = None
+
+    page = st.sidebar.radio(
+        "Page", ["Sign Document", "Verify Signature", "Key Management"]
+    )
+    algorithm = st.sidebar.selectbox("Signature algorithm", ALGORITHMS)
+    openssl_version, has_ifma_modexp = _openssl_info()
+    st.sidebar.caption(openssl_version)
+    if not has_ifma_modexp:
+        st.sidebar.warning(
+            "OpenSSL is older than 3.2 — RSA signing misses the AVX-IFMA "
+            "modexp kernels and runs up to ~2x slower."
+        )
+    if not _sha256_is_hardware_accelerated():
+        st.sidebar.warning(
+            "Hardware SHA-256 not detected — hashing will run several times "
+            "slower. Check that OpenSSL was not built with no-asm and that "
+            "OPENSSL_ia32cap is not masking SHA-NI."
+        )
+
+    if page == "Sign Document":
+        st.header("Sign a Document")
+        if st.session_state.private_key is None:
+            st.warning("Generate or import a key pair on the Key Management page first.")
+        else:
+            uploaded_file = st.file_uploader("Document to sign")
+            if uploaded_file is not None and st.button("Sign Document"):
+                signature = sign_file_stream(uploaded_file, st.session_state.private_key)
+                st.success("Document signed.")
+                st.text_area("Signature (base64)", signature.decode("ascii"), height=150)
+                st.download_button(
+                    "Download Signature",
+                    data=signature,
+                    file_name=uploaded_file.name + ".sig",
+                )
+
+    elif page == "Verify Signature":
+        st.header("Verify a Signature")
+        uploaded_file = st.file_uploader("Document")
+        signature_b64 = st.text_area("Signature (base64)")
+        key_file = st.file_uploader("Signer's public key (PEM)", type=["pem"])
+        if st.button("Verify Signature"):
+            public_key = None
+            if key_file is not None:
+                key_data = key_file.read()
+                try:
+                    public_key = _load_public_key(key_data)
+                except ValueError:
+                    st.error("Invalid public key file.")
+                    st.stop()
+                if not isinstance(
+                    public_key, (ed25519.Ed25519PublicKey, rsa.RSAPublicKey)
+                ):
+                    st.error("Unsupported key type — use an Ed25519 or RSA key.")
+                    st.stop()
+            elif st.session_state.public_key is not None:
+                public_key = st.session_state.public_key
+            if uploaded_file is None or not signature_b64 or public_key is None:
+                st.error("A document, signature and public key are all required.")
+            else:
+                digest = _cached_digest(uploaded_file)
+                if verify_document(digest, signature_b64, public_key):
+                    st.success("Signature is valid.")
+                else:
+                    st.error("Signature is INVALID.")
+
+        st.subheader("Batch Verification")
+        batch_files = st.file_uploader(
+            "Documents with their .sig files",
+            accept_multiple_files=True,
+            key="batch_files",
+        )
+        if batch_files and st.button("Verify Batch"):
+            public_key = None
+            if key_file is not None:
+                try:
+                    public_key = _load_public_key(key_file.getvalue())
+                except ValueError:
+                    st.error("Invalid public key file.")
+                    st.stop()
+                if not isinstance(
+                    public_key, (ed25519.Ed25519PublicKey, rsa.RSAPublicKey)
+                ):
+                    st.error("Unsupported key type — use an Ed25519 or RSA key.")
+                    st.stop()
+            elif st.session_state.public_key is not None:
+                public_key = st.session_state.public_key
+            signatures = {
+                f.name[: -len(".sig")]: f
+                for f in batch_files
+                if f.name.endswith(".sig")
+            }
+            documents = [
+                (f.name, f, signatures[f.name].getvalue())
+                for f in batch_files
+                if not f.name.endswith(".sig") and f.name in signatures
+            ]
+            if public_key is None:
+                st.error("A public key is required.")
+            elif not documents:
+                st.error("Upload each document together with its .sig file.")
+            else:
+                results = verify_batch(documents, public_key)
+                st.table(
+                    [
+                        {"Document": name, "Valid": "✅" if is_valid else "❌"}
+                        for name, is_valid in results
+                    ]
+                )
+
+    elif page == "Key Management":
+        st.header("Key Management")
+        if st.button("Generate New Key Pair"):
+            private_key, public_key = _generate_keys_async(algorithm)
+            st.session_state.private_key = private_key
+            st.session_state.public_key = public_key
+            st.session_state.private_key_pem = private_key_to_pem(private_key).decode()
+            st.session_state.public_key_pem = public_key_to_pem(public_key).decode()
+            st.success("New key pair generated.")
+
+        key_file = st.file_uploader("Import private key (PEM)", type=["pem"])
+        import_passphrase = st.text_input(
+            "Key passphrase (if encrypted)", type="password", key="import_passphrase"
+        )
+        if key_file is not None and st.button("Import Key"):
+            key_data = key_file.read()
+            try:
+                private_key = _load_private_key(key_data, import_passphrase or None)
+            except (TypeError, ValueError):
+                # ValueError: malformed PEM or wrong passphrase;
+                # TypeError: encrypted key with the passphrase field empty.
+                st.error("Wrong passphrase or invalid key file.")
+            else:
+                if not isinstance(
+                    private_key, (ed25519.Ed25519PrivateKey, rsa.RSAPrivateKey)
+                ):
+                    # Parses fine but sign_document can't use it (EC, DSA, ...).
+                    st.error("Unsupported key type — use an Ed25519 or RSA key.")
+                else:
+                    st.session_state.private_key = private_key
+                    st.session_state.public_key = private_key.public_key()
+                    st.session_state.private_key_pem = private_key_to_pem(
+                        private_key
+                    ).decode()
+                    st.session_state.public_key_pem = public_key_to_pem(
+                        st.session_state.public_key
+                    ).decode()
+                    st.success("Key pair imported.")
+
+        if st.session_state.private_key is not None:
+            st.subheader("Export Private Key")
+            private_pem = st.session_state.private_key_pem
+            with st.expander("Show private key PEM", expanded=False):
+                st.code(private_pem, language="text")
+            export_passphrase = st.text_input(
+                "Passphrase (encrypts the downloaded key)",
+                type="password",
+                key="export_passphrase",
+            )
+            if export_passphrase:
+                download_pem = private_key_to_pem(
+                    st.session_state.private_key, export_passphrase
+                )
+            else:
+                download_pem = private_pem
+            st.download_button(
+                "Download Private Key", data=download_pem, file_name="private_key.pem"
+            )
+
+            st.subheader("Export Public Key")
+            public_pem = st.session_state.public_key_pem
+            with st.expander("Show public key PEM", expanded=False):
+                st.code(public_pem, language="text")
+            st.download_button(
+                "Download Public Key", data=public_pem, file_name="public_key.pem"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,4 +13,27 @@ def build_doc(c):
         RuntimeError: If the documentation build command fails.
     """
 
-    c.run("sphinx-autobuild source/ build/")
\ No newline at end of file
+    c.run("sphinx-autobuild source/ build/")
+
+
+@task
+def run_app(c):
+    """Run the Streamlit signing app without file-watcher reruns.
+
+    Streamlit's default file watcher re-executes the script on every save,
+    which re-enters key generation and cache setup during development.
+    Disabling the watcher and run-on-save keeps reruns to explicit user
+    interactions only.
+    Args:
+        c: Execution context (e.g., an Invoke Context or similar) used to run
+           shell commands.
+    Raises:
+        RuntimeError: If the app command fails.
+    """
+
+    c.run(
+        "streamlit run streamlit_app/app.py"
+        " --server.fileWatcherType=none"
+        " --server.runOnSave=false"
+        " --browser.gatherUsageStats=false"
+    )
\ No newline at end of file